@@ -315,7 +315,7 @@ class Context(BaseContext):
                                          'dataset, initialize it as train_dataset')
         if model_classes and len(model_classes) == 0:
             raise DeepchecksValueError('Received empty model_classes')
-        if model_classes and sorted(model_classes) != model_classes:
+        if model_classes and any(model_classes[i] > model_classes[i + 1] for i in range(len(model_classes) - 1)):
             supported_models_link = doclink(
                 'nlp-supported-predictions-format',
                 template='For more information please refer to the Supported Tasks guide {link}')
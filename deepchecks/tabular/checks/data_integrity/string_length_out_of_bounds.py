@@ -150,9 +150,6 @@ class StringLengthOutOfBounds(SingleDatasetCheck):
                         string_length_column.between(lower_range, upper_range, inclusive='both')]
 
                     if not outlier_samples.empty:
-                        outlier_examples = column[outlier_samples[:self.samples_per_range_to_show].index]
-                        outlier_examples = [trim(x, self.outlier_length_to_show) for x in outlier_examples]
-
                         results[column_name]['normal_range'] = {
                             'min': non_outlier_lower_limit,
                             'max': non_outlier_upper_limit
@@ -166,6 +163,9 @@ class StringLengthOutOfBounds(SingleDatasetCheck):
                         })
 
                         if context.with_display:
+                            # Examples are only shown in the display, so gather and trim them only when needed
+                            outlier_examples = column[outlier_samples[:self.samples_per_range_to_show].index]
+                            outlier_examples = [trim(x, self.outlier_length_to_show) for x in outlier_examples]
                             display_format.append([column_name,
                                                    f'{format_number(non_outlier_lower_limit)} -'
                                                    f' {format_number(non_outlier_upper_limit)}',
@@ -13,6 +13,7 @@ import typing as t
 
 import numpy as np
 import pandas as pd
+from pandas.core.dtypes.missing import array_equivalent
 
 from deepchecks.core.context import BaseContext
 from deepchecks.core.errors import (DatasetValidationError, DeepchecksNotSupportedError, DeepchecksValueError,
@@ -75,77 +76,107 @@ class _DummyModel:
 
         if train is not None and test is not None:
             # check if datasets have same indexes
-            if set(train.data.index) & set(test.data.index):
-                train.data.index = map(lambda x: f'train-{x}', list(train.data.index))
-                test.data.index = map(lambda x: f'test-{x}', list(test.data.index))
+            if not train.data.index.intersection(test.data.index, sort=False).empty:
+                train.data.index = 'train-' + train.data.index.map(str)
+                test.data.index = 'test-' + test.data.index.map(str)
                 get_logger().warning('train and test datasets have common index - adding "train"/"test"'
                                      ' prefixes. To avoid that provide datasets with no common indexes '
                                      'or pass the model object instead of the predictions.')
 
         feature_df_list = []
         predictions = []
+        predictions_index = []
         probas = []
+        probas_index = []
+        model_classes_arr = np.asarray(model_classes) if model_classes is not None else None
 
         for dataset, y_pred, y_proba in zip([train, test],
                                             [y_pred_train, y_pred_test],
                                             [y_proba_train, y_proba_test]):
-            if y_pred is not None and not isinstance(y_pred, np.ndarray):
-                y_pred = np.array(y_pred)
-            if y_proba is not None and not isinstance(y_proba, np.ndarray):
-                y_proba = np.array(y_proba)
+            y_pred = np.asarray(y_pred) if y_pred is not None else None
+            y_proba = np.asarray(y_proba) if y_proba is not None else None
             if dataset is not None:
-                feature_df_list.append(dataset.features_columns)
+                # The features are only read to validate the data on predict
+                if validate_data_on_predict:
+                    feature_df_list.append(dataset.features_columns)
                 if y_pred is None and y_proba is not None:
                     validate_proba(y_proba, model_classes)
-                    y_pred = np.argmax(y_proba, axis=-1)
-                    y_pred = np.array(model_classes)[y_pred]
+                    y_pred = np.take(model_classes_arr, np.argmax(y_proba, axis=-1))
                 if y_pred is not None:
                     if len(y_pred.shape) > 1 and y_pred.shape[1] == 1:
                         y_pred = y_pred[:, 0]
                     ensure_predictions_shape(y_pred, dataset.data)
-                    y_pred_ser = pd.Series(y_pred, index=dataset.data.index)
-                    predictions.append(y_pred_ser)
+                    predictions.append(y_pred)
+                    predictions_index.append(dataset.data.index)
                     if y_proba is not None:
                         ensure_predictions_proba(y_proba, y_pred)
-                        proba_df = pd.DataFrame(data=y_proba)
-                        proba_df.index = dataset.data.index
-                        probas.append(proba_df)
-
-        self.predictions = pd.concat(predictions, axis=0) if predictions else None
-        self.probas = pd.concat(probas, axis=0) if probas else None
+                        probas.append(y_proba)
+                        probas_index.append(dataset.data.index)
+
+        # At most two parts, so join the values and indexes directly instead of aligning them with pandas concatenation
+        self.predictions = pd.Series(np.concatenate(predictions),
+                                     index=predictions_index[0].append(predictions_index[1:])) if predictions else None
+        self.probas = pd.DataFrame(np.concatenate(probas),
+                                   index=probas_index[0].append(probas_index[1:])) if probas else None
         self.feature_df_list = feature_df_list
         self.validate_data_on_predict = validate_data_on_predict
 
         if self.predictions is not None:
-            self.predict = self._predict
+            self._predictions_values = self.predictions.to_numpy()
+            # The validation flag is fixed for the model lifetime, so pick the predict variant once
+            self.predict = self._validated_predict if validate_data_on_predict else self._predict
 
         if self.probas is not None:
-            self.predict_proba = self._predict_proba
+            self._probas_values = self.probas.to_numpy()
+            self.predict_proba = self._validated_predict_proba if validate_data_on_predict else self._predict_proba
 
     def _validate_data(self, data: pd.DataFrame):
         data = data.sample(min(100, len(data)))
+        sample_positions = np.random.choice(len(data), size=min(30, len(data)), replace=False)
         for feature_df in self.feature_df_list:
-            # If all indices are found than test for equality in actual data (statistically significant portion)
-            if set(data.index).issubset(set(feature_df.index)):
-                sample_data = np.unique(np.random.choice(data.index, 30))
-                if feature_df.loc[sample_data].equals(data.loc[sample_data]):
+            # If all indices are found than test for equality in actual data (statistically significant portion).
+            # Dataset index is always unique, so the positions map one to one to the data samples.
+            positions = feature_df.index.get_indexer(data.index)
+            if (positions == -1).any():
+                continue
+            if feature_df.columns.equals(data.columns):
+                # Convert only the probed rows; array_equivalent compares NaN and object values like
+                # DataFrame.equals, but only on flat arrays
+                seen_values = feature_df.iloc[positions[sample_positions]].to_numpy()
+                sample_values = data.iloc[sample_positions].to_numpy()
+                if array_equivalent(seen_values.ravel(), sample_values.ravel(), strict_nan=True):
                     return
-                else:
-                    break
+            break
         raise DeepchecksValueError('Data that has not been seen before passed for inference with static '
                                    'predictions. Pass a real model to resolve this')
 
     def _predict(self, data: pd.DataFrame):
         """Predict on given data by the data indexes."""
-        if self.validate_data_on_predict:
-            self._validate_data(data)
-        return self.predictions.loc[data.index].to_numpy()
+        return self._take_by_index(self.predictions, self._predictions_values, data)
 
     def _predict_proba(self, data: pd.DataFrame):
         """Predict probabilities on given data by the data indexes."""
-        if self.validate_data_on_predict:
-            self._validate_data(data)
-        return self.probas.loc[data.index].to_numpy()
+        return self._take_by_index(self.probas, self._probas_values, data)
+
+    def _validated_predict(self, data: pd.DataFrame):
+        """Validate the data was seen before and predict on it by the data indexes."""
+        self._validate_data(data)
+        return self._predict(data)
+
+    def _validated_predict_proba(self, data: pd.DataFrame):
+        """Validate the data was seen before and predict probabilities on it by the data indexes."""
+        self._validate_data(data)
+        return self._predict_proba(data)
+
+    @staticmethod
+    def _take_by_index(stored: t.Union[pd.Series, pd.DataFrame], stored_values: np.ndarray, data: pd.DataFrame):
+        """Return the stored values matching the data indexes."""
+        # Dataset index is always unique and train/test indexes are prefixed on overlap, so the lookup is one to one
+        positions = stored.index.get_indexer(data.index)
+        if (positions == -1).any():
+            missing_labels = data.index[positions == -1]
+            raise KeyError(f'{len(missing_labels)} labels not in index, first ones: {list(missing_labels[:10])}')
+        return stored_values[positions]
 
     def fit(self, *args, **kwargs):
         """Just for python 3.6 (sklearn validates fit method)."""
@@ -220,7 +251,7 @@ class Context(BaseContext):
             feature_importance = validate_feature_importance(feature_importance, train.features)
         if model_classes and len(model_classes) == 0:
             raise DeepchecksValueError('Received empty model_classes')
-        if model_classes and sorted(model_classes) != model_classes:
+        if model_classes and any(model_classes[i] > model_classes[i + 1] for i in range(len(model_classes) - 1)):
             supported_models_link = doclink(
                 'supported-prediction-format',
                 template='For more information please refer to the Supported Models guide {link}')
@@ -246,7 +277,7 @@ class Context(BaseContext):
             if y_pred_train is None and model_classes is None:
                 # Does not calculate labels twice
                 labels = labels if labels is not None else get_all_labels(model, train, test, y_pred_train, y_pred_test)
-                observed_classes = sorted(labels.dropna().unique().tolist())
+                observed_classes = np.sort(pd.unique(labels.dropna().to_numpy())).tolist()
             model = _DummyModel(train=train, test=test,
                                 y_pred_train=y_pred_train, y_pred_test=y_pred_test,
                                 y_proba_test=y_proba_test, y_proba_train=y_proba_train,
@@ -254,6 +285,7 @@ class Context(BaseContext):
                                 model_classes=model_classes or observed_classes)
 
         self._task_type = task_type
+        self._labels = labels
         self._observed_classes = observed_classes
         self._model_classes = model_classes
         self._train = train
@@ -286,7 +318,8 @@ class Context(BaseContext):
         if self._model_classes is None and self.task_type in (TaskType.BINARY, TaskType.MULTICLASS):
             # If in infer_task_type we didn't find classes on model, or user didn't pass any, then using the observed
             get_logger().warning('Could not find model\'s classes, using the observed classes')
-            return self.observed_classes
+            # Cache the fallback so the warning is logged once and later calls are a plain attribute read
+            self._model_classes = self.observed_classes
         return self._model_classes
 
     @property
@@ -294,10 +327,16 @@ class Context(BaseContext):
         """Return the observed classes in both train and test. None for regression."""
         # If did not cache yet the observed classes than calculate them
         if self._observed_classes is None and self.task_type in (TaskType.BINARY, TaskType.MULTICLASS):
-            labels = get_all_labels(self._model, self._train, self._test)
-            self._observed_classes = sorted(labels.dropna().unique().tolist())
+            labels = self._get_labels()
+            self._observed_classes = np.sort(pd.unique(labels.dropna().to_numpy())).tolist()
         return self._observed_classes
 
+    def _get_labels(self) -> pd.Series:
+        """Return the labels aggregated from all available data, reusing the ones calculated on init."""
+        if self._labels is None:
+            self._labels = get_all_labels(self._model, self._train, self._test)
+        return self._labels
+
     @property
     def model_name(self):
         """Return model name."""
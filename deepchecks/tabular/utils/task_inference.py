@@ -27,27 +27,30 @@ __all__ = ['infer_task_type_by_labels', 'infer_classes_from_model', 'get_all_lab
 
 def infer_classes_from_model(model: Optional[BasicModel]):
     """Get classes_ attribute from model object if exists."""
-    if model is not None and hasattr(model, 'classes_') and len(model.classes_) > 0:
-        return sorted(list(model.classes_))
+    model_classes = getattr(model, 'classes_', None)
+    if model_classes is not None and len(model_classes) > 0:
+        return sorted(list(model_classes))
 
 
 def get_all_labels(model, train_dataset, test_dataset=None, y_pred_train=None, y_pred_test=None):
     """Aggregate labels from all available data: labels on datasets, y_pred, and model predicitions."""
-    labels = np.asarray([])
+    # Collect all the parts and concatenate once; the empty float array keeps numeric labels promoted to float
+    labels_parts = [np.asarray([])]
     if train_dataset:
         if train_dataset.has_label():
-            labels = np.append(labels, train_dataset.label_col.to_numpy())
+            labels_parts.append(train_dataset.label_col.to_numpy())
         if model:
-            labels = np.append(labels, sequence_to_numpy(model.predict(train_dataset.features_columns)))
+            labels_parts.append(sequence_to_numpy(model.predict(train_dataset.features_columns)))
     if test_dataset:
         if test_dataset.has_label():
-            labels = np.append(labels, test_dataset.label_col.to_numpy())
+            labels_parts.append(test_dataset.label_col.to_numpy())
         if model:
-            labels = np.append(labels, sequence_to_numpy(model.predict(test_dataset.features_columns)))
+            labels_parts.append(sequence_to_numpy(model.predict(test_dataset.features_columns)))
     if y_pred_train is not None:
-        labels = np.append(labels, y_pred_train)
+        labels_parts.append(y_pred_train)
     if y_pred_test is not None:
-        labels = np.append(labels, y_pred_test)
+        labels_parts.append(y_pred_test)
+    labels = np.concatenate([np.ravel(part) for part in labels_parts])
 
     return pd.Series(labels) if len(labels) > 0 else pd.Series(dtype='object')
 
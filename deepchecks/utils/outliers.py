@@ -42,8 +42,8 @@ def iqr_outliers_range(data: np.ndarray,
         raise DeepchecksValueError('IQR range must contain two numbers between 0 to 100')
 
     data = data.squeeze()
-    # Filter nulls
-    data = [x for x in data if pd.notnull(x)]
+    # Filter nulls with a single boolean mask instead of testing each value in python
+    data = data[pd.notnull(data)]
     if len(data) < min_samples:
         raise NotEnoughSamplesError(f'Need at least {min_samples} non-null samples to calculate IQR outliers, but got '
                                     f'{len(data)}')
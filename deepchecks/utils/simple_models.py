@@ -15,12 +15,11 @@ __all__ = ['PerfectModel', 'RandomModel', 'ClassificationUniformModel', 'Regress
 
 
 def create_proba_result(predictions, classes):
-    def prediction_to_proba(y_pred):
-        proba = np.zeros(len(classes))
-        proba[classes.index(y_pred)] = 1
-        return proba
-
-    return np.apply_along_axis(prediction_to_proba, axis=1, arr=predictions.reshape(-1, 1))
+    class_to_position = {cls: position for position, cls in enumerate(classes)}
+    predictions_positions = [class_to_position[y_pred] for y_pred in predictions]
+    proba = np.zeros((len(predictions_positions), len(classes)))
+    proba[np.arange(len(predictions_positions)), predictions_positions] = 1
+    return proba
 
 
 class PerfectModel:
@@ -90,9 +90,12 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
         """Initialize the properties state."""
         data = context.get_data_by_kind(dataset_kind)
         self._properties_results = defaultdict(list)
-        # Dict of properties names to a dict of containing keys of property values, images
-        self._lowest_property_value_images = defaultdict(list)
-        self._highest_property_value_images = defaultdict(list)
+        # Dict of properties names to whether the property returns a value per label (list per image) or per image
+        self._is_property_per_label = {}
+        # Dict of properties names to a dict of containing keys of property values, images. Entries are always set as
+        # a whole, so there is no need for a default factory
+        self._lowest_property_value_images = {}
+        self._highest_property_value_images = {}
         self._images_uuid = []
 
         self.properties_list = self.properties_list if self.properties_list else self.get_default_properties(data)
@@ -104,16 +107,19 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
         """Aggregate image properties from batch."""
         batch_properties = batch.vision_properties(self.properties_list, self.property_input_type)
         data = context.get_data_by_kind(dataset_kind)
-        for prop_name, property_values in batch_properties.items():
-            _ensure_property_shape(property_values, len(batch), prop_name)
-            # If the property or label is single value per image, wrap them in order to work on a fixed structure
-            if batch.numpy_labels is not None and data.task_type == TaskType.CLASSIFICATION:
-                labels = [[label_per_image] for label_per_image in batch.numpy_labels]
-            else:
-                labels = batch.numpy_labels
+        # Labels, images and identifiers are the same for all properties, so resolve them once per batch
+        # If the label is single value per image, wrap them in order to work on a fixed structure
+        if batch.numpy_labels is not None and data.task_type == TaskType.CLASSIFICATION:
+            labels = [[label_per_image] for label_per_image in batch.numpy_labels]
+        else:
+            labels = batch.numpy_labels
+        images = batch.numpy_images
+        batch_size = len(batch)
+        self._images_uuid += batch.numpy_image_identifiers
 
-            self._images_uuid += batch.numpy_image_identifiers
-            self._cache_property_values_and_images(batch.numpy_images, labels, list(property_values), prop_name)
+        for prop_name, property_values in batch_properties.items():
+            _ensure_property_shape(property_values, batch_size, prop_name)
+            self._cache_property_values_and_images(images, labels, list(property_values), prop_name)
 
     def compute(self, context: Context, dataset_kind: DatasetKind) -> CheckResult:
         """Compute final result."""
@@ -122,8 +128,11 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
         self._images_uuid = np.asarray(self._images_uuid)
 
         for name, values in self._properties_results.items():
-            values_lengths_cumsum = np.cumsum(np.array([len(v) for v in values]))
-            values_arr = np.hstack(values).astype(float)
+            if self._is_property_per_label[name]:
+                values_arr, values_lengths_cumsum = _flatten_property_values(values)
+            else:
+                # Single value per image, so the flatten index is already the image index
+                values_arr = np.asarray(values, dtype=np.float64)
 
             try:
                 lower_limit, upper_limit = iqr_outliers_range(values_arr, self.iqr_percentiles, self.iqr_scale)
@@ -131,26 +140,35 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
                 check_result[name] = 'Not enough non-null samples to calculate outliers.'
                 continue
 
-            outlier_values_idx = np.argwhere((values_arr < lower_limit) | (values_arr > upper_limit)).squeeze(axis=1)
-            outlier_img_idx = np.unique([_sample_index_from_flatten_index(values_lengths_cumsum, outlier_index)
-                                         for outlier_index in outlier_values_idx])
-            outlier_img_identifiers = self._images_uuid[outlier_img_idx] if len(outlier_img_idx) > 0 else []
+            outlier_values_idx = np.flatnonzero((values_arr < lower_limit) | (values_arr > upper_limit))
+            if len(outlier_values_idx) == 0:
+                outlier_img_identifiers = []
+            else:
+                if self._is_property_per_label[name]:
+                    outlier_img_idx = _sample_index_from_flatten_index(values_lengths_cumsum, outlier_values_idx)
+                    # Outlier indices are ascending and so are their image indices, so instead of sorting with
+                    # np.unique it is enough to drop consecutive duplicates
+                    outlier_img_idx = outlier_img_idx[np.diff(outlier_img_idx, prepend=-1) != 0]
+                else:
+                    outlier_img_idx = outlier_values_idx
+                outlier_img_identifiers = self._images_uuid[outlier_img_idx]
             check_result[name] = {
                 'outliers_identifiers': outlier_img_identifiers,
-                'lower_limit': max(lower_limit, min(values_arr)),
-                'upper_limit': min(upper_limit, max(values_arr)),
+                'lower_limit': max(lower_limit, np.nanmin(values_arr)),
+                'upper_limit': min(upper_limit, np.nanmax(values_arr)),
             }
 
         # Create display
         if context.with_display:
             display = []
-            no_outliers = pd.Series([], dtype='str')
+            # Pairs of (message, property name), collected and turned into a series once after the loop
+            no_outliers = []
             for property_name, info in check_result.items():
                 # If info is string it means there was error
                 if isinstance(info, str):
-                    no_outliers = pd.concat([no_outliers, pd.Series(property_name, index=[info])])
+                    no_outliers.append((info, property_name))
                 elif len(info['outliers_identifiers']) == 0:
-                    no_outliers = pd.concat([no_outliers, pd.Series(property_name, index=['No outliers found.'])])
+                    no_outliers.append(('No outliers found.', property_name))
                 else:
                     # Create id of alphabetic characters
                     images_and_values = self._get_property_outlier_images(property_name,
@@ -176,7 +194,9 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
                     display.append(html)
             display = [''.join(display)]
 
-            if not no_outliers.empty:
+            if no_outliers:
+                messages, property_names = zip(*no_outliers)
+                no_outliers = pd.Series(property_names, index=messages, dtype='str')
                 grouped = no_outliers.groupby(level=0).unique().str.join(', ')
                 grouped_df = pd.DataFrame(grouped, columns=['Properties'])
                 grouped_df['More Info'] = grouped_df.index
@@ -194,23 +214,15 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
                                      vision_data) -> t.List[t.Tuple[float, str]]:
         """Get outlier images and their values for provided property."""
         result = []
-        for idx, value in enumerate(self._lowest_property_value_images[prop_name]['property_values']):
-            value = value[0] if isinstance(value, t.Sequence) else value  # for property per bbox, value is a list
-            if value < lower_limit:
-                image_thumbnail = draw_image(image=self._lowest_property_value_images[prop_name]['images'][idx],
-                                             label=self._lowest_property_value_images[prop_name]['labels'][idx],
-                                             task_type=vision_data.task_type, draw_label=self._draw_label_on_image,
-                                             label_map=vision_data.label_map)
-                result.append((value, image_thumbnail))
-        for idx, value in enumerate(self._highest_property_value_images[prop_name]['property_values']):
-            value = value[0] if isinstance(value, t.Sequence) else value  # for property per bbox, value is a list
-            if value > upper_limit:
-                image_thumbnail = draw_image(
-                    image=self._highest_property_value_images[prop_name]['images'][idx],
-                    label=self._highest_property_value_images[prop_name]['labels'][idx],
-                    task_type=vision_data.task_type, draw_label=self._draw_label_on_image,
-                    label_map=vision_data.label_map)
-                result.append((value, image_thumbnail))
+        for stored_values_dict, is_lowest in ((self._lowest_property_value_images[prop_name], True),
+                                              (self._highest_property_value_images[prop_name], False)):
+            for value, image, label in zip(stored_values_dict['property_values'], stored_values_dict['images'],
+                                           stored_values_dict['labels']):
+                value = value[0] if isinstance(value, t.Sequence) else value  # for property per bbox, value is a list
+                if (value < lower_limit) if is_lowest else (value > upper_limit):
+                    image_thumbnail = draw_image(image=image, label=label, task_type=vision_data.task_type,
+                                                 draw_label=self._draw_label_on_image, label_map=vision_data.label_map)
+                    result.append((value, image_thumbnail))
         return result
 
     @abstractmethod
@@ -221,16 +233,22 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
     def _cache_property_values_and_images(self, images: t.List, labels: t.List, property_values: t.List,
                                           property_name: str):
         """Update the _lowest_property_value_images, _lowest_property_value_images dicts based on new batch."""
-        is_property_per_label = isinstance(property_values[0], (np.ndarray, t.Sequence))
+        # The output structure of a property is fixed, so inspect it only on the first batch
+        if property_name not in self._is_property_per_label:
+            self._is_property_per_label[property_name] = isinstance(property_values[0], (np.ndarray, t.Sequence))
+        is_property_per_label = self._is_property_per_label[property_name]
         # Update full property values cache for outlier calculation
-        if is_property_per_label:
-            self._properties_results[property_name].extend(property_values)
-        else:
-            self._properties_results[property_name].extend([[x] for x in property_values])
+        self._properties_results[property_name].extend(property_values)
+        # No images are shown, so there is nothing to cache for the display
+        if self.n_show_top == 0:
+            self._lowest_property_value_images[property_name] = {'images': [], 'property_values': [], 'labels': []}
+            self._highest_property_value_images[property_name] = {'images': [], 'property_values': [], 'labels': []}
+            return
         # In case there are no images or no labels put none instead and do not display images / labels
         images = [None] * len(property_values) if images is None else images
         if labels is None:
-            labels = [[None]] * len(property_values) if is_property_per_label else [None] * len(property_values)
+            labels = [[None] * len(v) for v in property_values] if is_property_per_label \
+                else [None] * len(property_values)
 
         # adds the current lowest and highest property value images/labels/values to the batch before sorting
         if property_name in self._lowest_property_value_images:
@@ -241,38 +259,48 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
                 property_values = stored_values_dict['property_values'] + property_values
 
         if is_property_per_label:  # if property is per label flatten the list of lists to find lowest and highest
-            values_lengths_cumsum = np.cumsum(np.array([len(v) for v in property_values]))
-            property_values = np.hstack(property_values).astype(float)
-            labels = np.asarray([item for sublist in labels for item in sublist], dtype='object')
+            property_values, values_lengths_cumsum = _flatten_property_values(property_values)
+            # Flat index of the first value of each image, used to locate a value's label inside its image labels
+            images_start_index = np.concatenate(([0], values_lengths_cumsum[:-1]))
 
         # calculate lowest and highest property values
-        not_null_indices = [idx for idx, value in enumerate(property_values) if value is not None]
+        # converting once to a float array, in which missing values (None) become nan
+        property_values_arr = np.asarray(property_values, dtype=np.float64)
+        not_null_indices = np.flatnonzero(~np.isnan(property_values_arr))
         if len(not_null_indices) <= self.n_show_top:
             lowest_values_idx = not_null_indices
             highest_values_idx = not_null_indices
         else:
-            lowest_values_idx = np.argpartition([np.inf if v is None else v for v in property_values],
-                                                self.n_show_top)[:self.n_show_top]
-            highest_values_idx = np.argpartition([np.NINF if v is None else v for v in property_values],
-                                                 -self.n_show_top)[-self.n_show_top:]
+            # Partition only the non-null values for both directions, instead of filling the nulls in two copies
+            not_null_values = property_values_arr[not_null_indices]
+            lowest_values_idx = not_null_indices[np.argpartition(not_null_values, self.n_show_top)[:self.n_show_top]]
+            highest_values_idx = \
+                not_null_indices[np.argpartition(not_null_values, -self.n_show_top)[-self.n_show_top:]]
 
         if is_property_per_label:
-            lowest_img_idx = [_sample_index_from_flatten_index(values_lengths_cumsum, x) for x in lowest_values_idx]
-            highest_img_idx = [_sample_index_from_flatten_index(values_lengths_cumsum, x) for x in highest_values_idx]
+            lowest_img_idx = _sample_index_from_flatten_index(values_lengths_cumsum, lowest_values_idx)
+            highest_img_idx = _sample_index_from_flatten_index(values_lengths_cumsum, highest_values_idx)
+            # Gather only the labels of the selected values, instead of flattening the labels of all images
+            lowest_labels = [[labels[img_idx][value_idx - images_start_index[img_idx]]]
+                             for value_idx, img_idx in zip(lowest_values_idx, lowest_img_idx)]
+            highest_labels = [[labels[img_idx][value_idx - images_start_index[img_idx]]]
+                              for value_idx, img_idx in zip(highest_values_idx, highest_img_idx)]
         else:
             lowest_img_idx = lowest_values_idx
             highest_img_idx = highest_values_idx
+            lowest_labels = [labels[x] for x in lowest_values_idx]
+            highest_labels = [labels[x] for x in highest_values_idx]
 
         self._lowest_property_value_images[property_name] = \
             {'images': [images[x] for x in lowest_img_idx],
              'property_values': [[property_values[x]] if is_property_per_label else property_values[x]
                                  for x in lowest_values_idx],
-             'labels': [[labels[x]] if is_property_per_label else labels[x] for x in lowest_values_idx]}
+             'labels': lowest_labels}
         self._highest_property_value_images[property_name] = \
             {'images': [images[x] for x in highest_img_idx],
              'property_values': [[property_values[x]] if is_property_per_label else property_values[x]
                                  for x in highest_values_idx],
-             'labels': [[labels[x]] if is_property_per_label else labels[x] for x in highest_values_idx]}
+             'labels': highest_labels}
 
 
 def _ensure_property_shape(property_values, data_len, prop_name):
@@ -300,12 +328,26 @@ def _is_list_of_numbers(l):
     return not any(i is not None and not isinstance(i, Number) for i in l)
 
 
-def _sample_index_from_flatten_index(cumsum_lengths, flatten_index) -> int:
+def _flatten_property_values(values) -> t.Tuple[np.ndarray, np.ndarray]:
+    """Flatten property values per image into a single float array, and return it with the cumulative lengths."""
+    values_lengths_cumsum = np.cumsum(np.fromiter((len(v) for v in values), dtype=np.intp, count=len(values)))
+    # Filling one float array avoids the extra copy of stacking and then casting
+    values_arr = np.empty(values_lengths_cumsum[-1] if len(values_lengths_cumsum) > 0 else 0, dtype=np.float64)
+    start = 0
+    for value, end in zip(values, values_lengths_cumsum):
+        values_arr[start:end] = value
+        start = end
+    return values_arr, values_lengths_cumsum
+
+
+def _sample_index_from_flatten_index(cumsum_lengths, flatten_index):
     # The cumulative sum lengths is holding the cumulative sum of properties per image, so the first index which value
     # is greater than the flatten index, is the image index.
     # for example if the sums lengths is [1, 6, 11, 13, 16, 20] and the flatten index = 6, it means this property
     # belong to the third image which is index = 2.
-    return np.argwhere(cumsum_lengths > flatten_index)[0][0]
+    # Works on a single flatten index as well as on an array of them, using a binary search over the sorted
+    # cumulative lengths.
+    return np.searchsorted(cumsum_lengths, flatten_index, side='right')
 
 
 NO_IMAGES_TEMPLATE = """
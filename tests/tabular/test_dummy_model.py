@@ -8,7 +8,9 @@
 # along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------------
 #
-from hamcrest import assert_that, calling, has_items, raises, close_to
+import numpy as np
+import pandas as pd
+from hamcrest import assert_that, calling, close_to, equal_to, has_items, raises
 
 from deepchecks.core.check_result import CheckResult
 from deepchecks.core.condition import ConditionCategory
@@ -175,6 +177,54 @@ def test_new_data(diabetes_split_dataset_and_model):
             r'resolve this')
     )
 
+def _context_with_static_predictions():
+    data = pd.DataFrame({'a': np.arange(100), 'b': np.arange(100) * 0.5, 'label': [0, 1] * 50})
+    dataset = Dataset(data, label='label', cat_features=[])
+    return Context(dataset, y_pred_train=dataset.label_col.to_numpy()), dataset
+
+
+def test_predict_on_seen_data_with_changed_dtype():
+    # Arrange
+    context, dataset = _context_with_static_predictions()
+    data = dataset.features_columns.astype({'a': 'float'})
+
+    # Act
+    predictions = context.model.predict(data)
+
+    # Assert - the values are the same, so the data is considered seen
+    assert_that(predictions.tolist(), equal_to(dataset.label_col.tolist()))
+
+
+def test_predict_on_seen_index_with_changed_values():
+    # Arrange
+    context, dataset = _context_with_static_predictions()
+    data = dataset.features_columns.assign(a=dataset.features_columns['a'] + 1)
+
+    # Act & Assert
+    assert_that(
+        calling(context.model.predict).with_args(data),
+        raises(
+            DeepchecksValueError,
+            r'Data that has not been seen before passed for inference with static predictions. Pass a real model to '
+            r'resolve this')
+    )
+
+
+def test_predict_on_seen_index_with_mismatched_columns():
+    # Arrange
+    context, dataset = _context_with_static_predictions()
+    data = dataset.features_columns.rename(columns={'a': 'c'})
+
+    # Act & Assert
+    assert_that(
+        calling(context.model.predict).with_args(data),
+        raises(
+            DeepchecksValueError,
+            r'Data that has not been seen before passed for inference with static predictions. Pass a real model to '
+            r'resolve this')
+    )
+
+
 def test_bad_pred_shape(diabetes_split_dataset_and_model):
     # Arrange
     train, test, clf = diabetes_split_dataset_and_model
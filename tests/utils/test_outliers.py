@@ -27,3 +27,11 @@ def test_iqr_range():
     assert_that(calling(iqr_outliers_range).with_args(data, (25, 75), 1, min_samples=100),
                 raises(NotEnoughSamplesError,
                        'Need at least 100 non-null samples to calculate IQR outliers, but got 10'))
+
+
+def test_iqr_range_single_sample():
+    data = np.array([5.0])
+
+    assert_that(calling(iqr_outliers_range).with_args(data, (25, 75), 1),
+                raises(NotEnoughSamplesError,
+                       'Need at least 10 non-null samples to calculate IQR outliers, but got 1'))
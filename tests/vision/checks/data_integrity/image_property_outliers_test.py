@@ -10,8 +10,8 @@
 #
 
 import numpy as np
-from hamcrest import (all_of, any_of, assert_that, calling, close_to, equal_to, has_entries, has_key, has_length,
-                      has_properties, instance_of, is_, raises)
+from hamcrest import (all_of, any_of, assert_that, calling, close_to, contains_string, equal_to, has_entries, has_key,
+                      has_length, has_properties, instance_of, is_, is_not, raises)
 from hamcrest.core.matcher import Matcher
 
 from deepchecks.core import CheckResult
@@ -99,6 +99,20 @@ def test_image_property_outliers_check_mnist(mnist_visiondata_train):
     }))
 
 
+def test_image_property_outliers_check_mnist_without_images(mnist_visiondata_train):
+    # Act
+    result = ImagePropertyOutliers(n_show_top=0).run(mnist_visiondata_train)
+
+    # Assert - outliers are still found, but no thumbnails are displayed
+    assert_that(result.value, has_entries({
+        'Brightness': has_entries({
+            'outliers_identifiers': has_length(5)
+        })
+    }))
+    assert_that(result.display[0], all_of(contains_string('Total number of outliers'),
+                                          is_not(contains_string('<img'))))
+
+
 def test_run_on_data_with_only_images(mnist_train_only_images):
     # Act - Assert check runs without exception
     result = ImagePropertyOutliers().run(mnist_train_only_images)
@@ -106,6 +120,25 @@ def test_run_on_data_with_only_images(mnist_train_only_images):
     assert_that(result, is_correct_image_property_outliers_result())
 
 
+def test_property_per_label_on_data_with_only_images(mnist_train_only_images):
+    # Arrange - a property returning a list of values per image, on data that has no labels to pair them with
+    def property_per_image_row(images):
+        return [[float(row.mean()) for row in image[:3]] for image in images]
+
+    image_properties = [{
+        'name': 'test',
+        'method': property_per_image_row,
+        'output_type': 'numerical'
+    }]
+    check = ImagePropertyOutliers(image_properties=image_properties)
+    # Act
+    result = check.run(mnist_train_only_images)
+    # Assert
+    assert_that(result.value, has_entries({
+        'test': instance_of(dict)
+    }))
+
+
 def test_run_on_custom_task(mnist_train_custom_task):
     # Act - Assert check runs without exception
     result = ImagePropertyOutliers().run(mnist_train_custom_task)
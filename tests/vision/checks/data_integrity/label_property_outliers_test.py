@@ -8,8 +8,8 @@
 # along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------------
 #
-from hamcrest import (all_of, any_of, assert_that, calling, close_to, contains_exactly, equal_to, has_entries, has_key,
-                      has_length, has_properties, instance_of, is_, raises)
+from hamcrest import (all_of, any_of, assert_that, calling, close_to, contains_exactly, contains_string, equal_to,
+                      has_entries, has_key, has_length, has_properties, instance_of, is_, is_not, raises)
 from hamcrest.core.matcher import Matcher
 
 from deepchecks.core import CheckResult
@@ -52,7 +52,7 @@ def test_outliers_check_coco(coco_visiondata_train):
     assert_that(result, is_correct_label_property_outliers_result(DEFAULT_OBJECT_DETECTION_LABEL_PROPERTIES))
     assert_that(result.value, has_entries({
         'Number of Bounding Boxes Per Image': has_entries({
-            'outliers_identifiers': contains_exactly('21', '30', '1', '5', '11', '20'),
+            'outliers_identifiers': contains_exactly('21', '30', '33', '37', '43', '52'),
             'lower_limit': is_(0),
             'upper_limit': is_(20.125)
         }),
@@ -96,7 +96,7 @@ def test_outliers_check_coco_without_display(coco_visiondata_train):
                 is_correct_label_property_outliers_result(DEFAULT_OBJECT_DETECTION_LABEL_PROPERTIES, with_display=False))
     assert_that(result.value, has_entries({
         'Number of Bounding Boxes Per Image': has_entries({
-            'outliers_identifiers': contains_exactly('21', '30', '1', '5', '11', '20'),
+            'outliers_identifiers': contains_exactly('21', '30', '33', '37', '43', '52'),
             'lower_limit': is_(0),
             'upper_limit': is_(20.125)
         }),
@@ -104,6 +104,20 @@ def test_outliers_check_coco_without_display(coco_visiondata_train):
     }))
 
 
+def test_outliers_check_coco_without_images(coco_visiondata_train):
+    # Act
+    result = LabelPropertyOutliers(n_show_top=0).run(coco_visiondata_train)
+
+    # Assert - outliers are still found, but no thumbnails are displayed
+    assert_that(result.value, has_entries({
+        'Number of Bounding Boxes Per Image': has_entries({
+            'outliers_identifiers': has_length(6)
+        })
+    }))
+    assert_that(result.display[0], all_of(contains_string('Total number of outliers'),
+                                          is_not(contains_string('<img'))))
+
+
 def test_property_outliers_check_mnist(mnist_visiondata_train):
     # Arrange
     properties = [{
@@ -126,6 +140,31 @@ def test_property_outliers_check_mnist(mnist_visiondata_train):
     }))
 
 
+def test_outliers_identifiers_with_multiple_properties_and_batches(mnist_visiondata_train):
+    # Arrange - the second property marks the first image of every batch except the first one as an outlier
+    images_seen = [0]
+
+    def first_image_of_later_batches(labels):
+        batch_start = images_seen[0]
+        images_seen[0] += len(labels)
+        return [100 if batch_start > 0 and index == 0 else 0 for index in range(len(labels))]
+
+    properties = [
+        {'name': 'label', 'method': lambda labels: labels, 'output_type': 'numerical'},
+        {'name': 'batch start', 'method': first_image_of_later_batches, 'output_type': 'numerical'}
+    ]
+    check = LabelPropertyOutliers(label_properties=properties)
+    # Act
+    result = check.run(mnist_visiondata_train)
+
+    # Assert - 200 images in batches of 64, so the later batches start at images 64, 128 and 192
+    assert_that(result.value, has_entries({
+        'batch start': has_entries({
+            'outliers_identifiers': contains_exactly('64', '128', '192'),
+        })
+    }))
+
+
 def test_run_on_data_with_only_labels(coco_test_only_labels):
     # Act - Assert check runs without exception
     result = LabelPropertyOutliers().run(coco_test_only_labels)